@@ -172,6 +172,7 @@ class ImmutableMemory(collections.abc.Sequence,
             :meth:`__bytes__`
             :meth:`__repr__`
             :meth:`__str__`
+            :meth:`crc32`
             :meth:`hex`
             :meth:`hexdump`
             :meth:`read`
@@ -202,6 +203,7 @@ class ImmutableMemory(collections.abc.Sequence,
             :meth:`count`
             :meth:`equal_span`
             :meth:`find`
+            :meth:`find_all`
             :meth:`index`
             :meth:`rfind`
             :meth:`rindex`
@@ -1692,6 +1694,70 @@ class ImmutableMemory(collections.abc.Sequence,
         """
         ...
 
+    @abc.abstractmethod
+    def crc32(
+        self,
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+        pattern: Optional[Union[AnyBytes, Value]] = None,
+    ) -> int:
+        r"""Computes the CRC-32 checksum.
+
+        The checksum is the same as :func:`zlib.crc32` over the data within
+        the selected range, but it is computed block by block, without
+        exporting the whole range as a single :obj:`bytes` object.
+
+        Emptiness within the range is filled with `pattern`, aligned to
+        `start`, as per :meth:`values`.
+        If `pattern` is ``None``, the range must be contiguous.
+
+        Arguments:
+            start (int):
+                Inclusive start address.
+                If ``None``, :attr:`start` is considered.
+
+            endex (int):
+                Exclusive end address.
+                If ``None``, :attr:`endex` is considered.
+
+            pattern (items):
+                Pattern of items to fill the emptiness.
+                If ``None``, emptiness is not allowed.
+
+        Returns:
+            int: Unsigned 32-bit CRC-32 checksum.
+
+        Raises:
+            :obj:`ValueError`: Data not contiguous (see :attr:`contiguous`).
+
+        See Also:
+            :meth:`to_bytes`
+            :meth:`values`
+
+        Examples:
+            >>> from bytesparse import Memory
+            >>> import zlib
+
+            +---+---+---+---+---+---+---+---+---+
+            | 0 | 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8 |
+            +===+===+===+===+===+===+===+===+===+
+            |   |[A | B | C]|   |[x | y | z]|   |
+            +---+---+---+---+---+---+---+---+---+
+
+            >>> memory = Memory.from_blocks([[1, b'ABC'], [5, b'xyz']])
+            >>> memory.crc32(1, 4) == zlib.crc32(b'ABC')
+            True
+            >>> hex(memory.crc32(pattern=b'.'))
+            '0x76f19335'
+            >>> memory.crc32(pattern=b'.') == zlib.crc32(b'ABC.xyz')
+            True
+            >>> memory.crc32()
+            Traceback (most recent call last):
+                ...
+            ValueError: non-contiguous data within range
+        """
+        ...
+
     @property
     @abc.abstractmethod
     def endex(
@@ -1937,6 +2003,60 @@ class ImmutableMemory(collections.abc.Sequence,
         """
         ...
 
+    @abc.abstractmethod
+    def find_all(
+        self,
+        items: Iterable[Union[AnyBytes, Value]],
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+    ) -> Iterator[Tuple[Address, int]]:
+        r"""Finds all the occurrences of many items.
+
+        Searches each item separately within each block, lazily merging
+        every occurrence, overlapping ones included, sorted by address.
+        Occurrences of different items at the same address are yielded in
+        the same order as `items`.
+
+        Arguments:
+            items (list of items):
+                Values to find. Each can be either some non-empty byte string
+                or an integer.
+
+            start (int):
+                Inclusive start of the searched range.
+                If ``None``, :attr:`start` is considered.
+
+            endex (int):
+                Exclusive end of the searched range.
+                If ``None``, :attr:`endex` is considered.
+
+        Yields:
+            (int, int): Address of an occurrence, and index of the matching
+            item within `items`.
+
+        Raises:
+            :obj:`ValueError`: Empty item.
+
+        See Also:
+            :meth:`find`
+
+        Examples:
+            >>> from bytesparse import Memory
+
+            +---+---+---+---+---+---+---+---+---+---+---+---+
+            | 0 | 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8 | 9 | 10| 11|
+            +===+===+===+===+===+===+===+===+===+===+===+===+
+            |   |[A | B | C]|   |[B | a | t]|   |[t | a | b]|
+            +---+---+---+---+---+---+---+---+---+---+---+---+
+
+            >>> memory = Memory.from_blocks([[1, b'ABC'], [5, b'Bat'], [9, b'tab']])
+            >>> list(memory.find_all([b'a', b'B']))
+            [(2, 1), (5, 1), (6, 0), (10, 0)]
+            >>> list(memory.find_all([b'at', ord('t'), b'ta'], 6, 11))
+            [(6, 0), (7, 1), (9, 1), (9, 2)]
+        """
+        ...
+
     @classmethod
     @abc.abstractmethod
     def from_blocks(
@@ -3405,6 +3525,7 @@ class MutableMemory(ImmutableMemory,
             :meth:`insert`
             :meth:`reserve`
             :meth:`write`
+            :meth:`write_many`
 
         Deletion:
             :meth:`__delitem__`
@@ -3435,6 +3556,7 @@ class MutableMemory(ImmutableMemory,
             :meth:`shift_backup`
             :meth:`update_backup`
             :meth:`write_backup`
+            :meth:`write_many_backup`
 
         Restore:
             :meth:`align_restore`
@@ -3454,6 +3576,7 @@ class MutableMemory(ImmutableMemory,
             :meth:`setdefault_restore`
             :meth:`shift_restore`
             :meth:`update_restore`
+            :meth:`write_many_restore`
             :meth:`write_restore`
 
         Internal:
@@ -5497,6 +5620,95 @@ class MutableMemory(ImmutableMemory,
         """
         ...
 
+    @abc.abstractmethod
+    def write_many(
+        self,
+        items: Iterable[Tuple[Address, Union[AnyBytes, Value, ImmutableMemory]]],
+        clear: bool = False,
+    ) -> None:
+        r"""Writes many data chunks.
+
+        Equivalent to calling :meth:`write` for each `(address, data)` pair,
+        in the given order.
+        Consecutive pairs where `data` is a byte string or a byte value, and
+        the address continues right after the previous chunk, are joined and
+        written at once.
+
+        Arguments:
+            items (iterable):
+                Sequence of `(address, data)` pairs, where `data` is a byte
+                string, a byte value, or a memory object.
+
+            clear (bool):
+                Clears the target range before writing data.
+                Useful only if `data` is a :obj:`ImmutableMemory` with empty spaces.
+
+        See Also:
+            :meth:`write`
+            :meth:`write_many_backup`
+            :meth:`write_many_restore`
+
+        Examples:
+            >>> from bytesparse import Memory
+
+            +---+---+---+---+---+---+---+---+---+---+
+            | 0 | 1 | 2 | 3 | 4 | 5 | 6 | 7 | 8 | 9 |
+            +===+===+===+===+===+===+===+===+===+===+
+            |   |[A | B | C]|   |   |[x | y | z]|   |
+            +---+---+---+---+---+---+---+---+---+---+
+            |   |[A | B | C]|   |[1 | 2 | 3 | z | $]|
+            +---+---+---+---+---+---+---+---+---+---+
+
+            >>> memory = Memory.from_blocks([[1, b'ABC'], [6, b'xyz']])
+            >>> memory.write_many([(5, b'12'), (7, b'3'), (9, ord('$'))])
+            >>> memory.to_blocks()
+            [[1, b'ABC'], [5, b'123z$']]
+        """
+        ...
+
+    @abc.abstractmethod
+    def write_many_backup(
+        self,
+        items: Iterable[Tuple[Address, Union[AnyBytes, Value, ImmutableMemory]]],
+        clear: bool = False,
+    ) -> List[ImmutableMemory]:
+        r"""Backups a `write_many()` operation.
+
+        Arguments:
+            items (iterable):
+                Sequence of `(address, data)` pairs, where `data` is a byte
+                string, a byte value, or a memory object.
+
+            clear (bool):
+                Clears the target range before writing data.
+                Useful only if `data` is a :obj:`Memory` with empty spaces.
+
+        Returns:
+            list of :obj:`ImmutableMemory`: Backup memory regions.
+
+        See Also:
+            :meth:`write_many`
+            :meth:`write_many_restore`
+        """
+        ...
+
+    @abc.abstractmethod
+    def write_many_restore(
+        self,
+        backups: Sequence[ImmutableMemory],
+    ) -> None:
+        r"""Restores a `write_many()` operation.
+
+        Arguments:
+            backups (list of :obj:`ImmutableMemory`):
+                Backup memory regions to restore.
+
+        See Also:
+            :meth:`write_many`
+            :meth:`write_many_backup`
+        """
+        ...
+
     @abc.abstractmethod
     def write_restore(
         self,
@@ -31,10 +31,15 @@ to hold block data, which allows mutable in-place operations.
 
 import io
 import sys
+import zlib
+from bisect import bisect_right as _bisect_right
+from functools import partial as _partial
+from heapq import merge as _merge
 from itertools import count as _count
 from itertools import islice as _islice
 from itertools import repeat as _repeat
 from itertools import zip_longest as _zip_longest
+from operator import itemgetter as _itemgetter
 from typing import Any
 from typing import ByteString
 from typing import Iterable
@@ -65,6 +70,125 @@ from .base import OpenInterval
 from .base import Value
 
 
+def _bisect_blocks_py(
+    blocks: BlockSequence,
+    address: Address,
+) -> BlockIndex:
+    r"""Bisects blocks by start address.
+
+    Arguments:
+        blocks (list of blocks):
+            A sequence of spaced blocks, sorted by address.
+
+        address (int):
+            Address to locate.
+
+    Returns:
+        int: Number of blocks starting at or before `address`.
+    """
+
+    left = 0
+    right = len(blocks)
+
+    while left < right:
+        center = (left + right) >> 1
+        if address < blocks[center][0]:
+            right = center
+        else:
+            left = center + 1
+
+    return left
+
+
+_bisect_blocks = _bisect_blocks_py
+
+if sys.version_info >= (3, 10):  # pragma: no branch
+    _bisect_blocks = _partial(_bisect_right, key=_itemgetter(0))  # faster
+
+
+def _crc32_pattern(
+    pattern: Optional[ByteString],
+    offset: Address,
+    size: Address,
+    value: int,
+) -> int:
+    r"""Pattern repetition CRC-32.
+
+    Arguments:
+        pattern (bytes):
+            The pattern to repeat, or ``None`` to forbid filling.
+
+        offset (int):
+            Index of the first value within the pattern. Wraparound supported.
+
+        size (int):
+            Size of the repeated pattern.
+
+        value (int):
+            Running CRC-32 value.
+
+    Returns:
+        int: Updated CRC-32 value.
+
+    Raises:
+        :obj:`ValueError`: Pattern required.
+    """
+
+    if pattern is None:
+        raise ValueError('non-contiguous data within range')
+
+    pattern_size = len(pattern)
+    offset %= pattern_size
+    if offset:
+        pattern = pattern[offset:] + pattern[:offset]
+
+    # Chunks are whole patterns, so that they stay aligned
+    times = min(size // pattern_size + 1, (0x10000 // pattern_size) or 1)
+    chunk = pattern * times
+    chunk_size = len(chunk)
+
+    while size > chunk_size:
+        value = zlib.crc32(chunk, value)
+        size -= chunk_size
+
+    return zlib.crc32(chunk[:size], value)
+
+
+def _find_iter(
+    data: ByteString,
+    item: Union[AnyBytes, Value],
+    index: int,
+    start: Address,
+    endex: Address,
+) -> Iterator[Tuple[Address, int]]:
+    r"""Iterates item occurrences.
+
+    Arguments:
+        data (bytes):
+            Data to search.
+
+        item (bytes):
+            Item to find, either some non-empty byte string or an integer.
+
+        index (int):
+            Index of the item, yielded along with each occurrence.
+
+        start (int):
+            Inclusive start offset of the searched range.
+
+        endex (int):
+            Exclusive end offset of the searched range.
+
+    Yields:
+        (int, int): Occurrence offset, item index; overlapping ones included.
+    """
+
+    offset = data.find(item, start, endex)
+    while offset >= 0:
+        yield offset, index
+        offset = data.find(item, offset + 1, endex)
+
+
 def _repeat2(
     pattern: Optional[ByteString],
     offset: Address,
@@ -94,36 +218,31 @@ def _repeat2(
             yield from _repeat(None, size)
 
     else:
+        pattern = bytes(pattern)
         pattern_size = len(pattern)
+        offset %= pattern_size
         if offset:
-            offset %= pattern_size
+            pattern = pattern[offset:] + pattern[:offset]
 
-            if size is None:
-                while 1:
-                    yield from _islice(pattern, offset, pattern_size)
-                    yield from _islice(pattern, offset)
+        # Tile whole patterns, so that chunks stay aligned
+        times = (0x1000 // pattern_size) or 1
 
-            else:
-                for _ in range(size // pattern_size):
-                    yield from _islice(pattern, offset, pattern_size)
-                    yield from _islice(pattern, offset)
-
-                size %= pattern_size
-                chunk_size = pattern_size - offset
-                if size < chunk_size:
-                    chunk_size = size
-                yield from _islice(pattern, offset, offset + chunk_size)
-                yield from _islice(pattern, size - chunk_size)
-        else:
-            if size is None:
-                while 1:
-                    yield from pattern
+        if size is None:
+            chunk = pattern * times
+            while 1:
+                yield from chunk
 
-            else:
-                for _ in range(size // pattern_size):
-                    yield from pattern
+        elif 0 < size:
+            if size // pattern_size < times:
+                times = size // pattern_size + 1
+            chunk = pattern * times
+            chunk_size = len(chunk)
+
+            while size > chunk_size:
+                yield from chunk
+                size -= chunk_size
 
-                yield from _islice(pattern, size % pattern_size)
+            yield from _islice(chunk, size)
 
 
 class Memory(MutableMemory):
@@ -181,7 +300,10 @@ class Memory(MutableMemory):
         item: Union[AnyBytes, Value],
     ) -> bool:
 
-        return any(item in block_data for _, block_data in self._blocks)
+        for _, block_data in self._blocks:
+            if item in block_data:
+                return True
+        return False
 
     def __copy__(
         self,
@@ -319,6 +441,7 @@ class Memory(MutableMemory):
         self._blocks: BlockList = []
         self._bound_start: Optional[Address] = start
         self._bound_endex: Optional[Address] = endex
+        self._block_index_cache: BlockIndex = 0
 
     def __ior__(
         self,
@@ -475,30 +598,20 @@ class Memory(MutableMemory):
     ) -> Optional[BlockIndex]:
 
         blocks = self._blocks
-        if blocks:
-            if address < blocks[0][0]:  # before first block
-                return None
-
-            block_start, block_data = blocks[-1]
-            if block_start + len(block_data) <= address:  # after last block
-                return None
-        else:
-            return None
+        block_index = self._block_index_cache
 
-        # Dichotomic search
-        left = 0
-        right = len(blocks)
+        if block_index < len(blocks):  # sequential accesses hit the last block
+            block_start, block_data = blocks[block_index]
+            if block_start <= address < block_start + len(block_data):
+                return block_index
 
-        while left <= right:
-            center = (left + right) >> 1
-            block_start, block_data = blocks[center]
+        block_index = _bisect_blocks(blocks, address) - 1
 
-            if block_start + len(block_data) <= address:  # after center block
-                left = center + 1
-            elif address < block_start:  # before center block
-                right = center - 1
-            else:  # within center block
-                return center
+        if block_index >= 0:
+            block_start, block_data = blocks[block_index]
+            if address < block_start + len(block_data):  # within block
+                self._block_index_cache = block_index
+                return block_index
 
         return None
 
@@ -507,33 +620,7 @@ class Memory(MutableMemory):
         address: Address,
     ) -> BlockIndex:
 
-        blocks = self._blocks
-        if blocks:
-            if address < blocks[0][0]:  # before first block
-                return 0
-
-            block_start, block_data = blocks[-1]
-            if block_start + len(block_data) <= address:  # after last block
-                return len(blocks)
-        else:
-            return 0
-
-        # Dichotomic search
-        left = 0
-        right = len(blocks)
-
-        while left <= right:
-            center = (left + right) >> 1
-            block_start, block_data = blocks[center]
-
-            if block_start + len(block_data) <= address:  # after center block
-                left = center + 1
-            elif address < block_start:  # before center block
-                right = center - 1
-            else:  # within center block
-                return center + 1
-
-        return right + 1
+        return _bisect_blocks(self._blocks, address)
 
     def _block_index_start(
         self,
@@ -541,32 +628,14 @@ class Memory(MutableMemory):
     ) -> BlockIndex:
 
         blocks = self._blocks
-        if blocks:
-            if address <= blocks[0][0]:  # before first block
-                return 0
-
-            block_start, block_data = blocks[-1]
-            if block_start + len(block_data) <= address:  # after last block
-                return len(blocks)
-        else:
-            return 0
+        block_index = _bisect_blocks(blocks, address)
 
-        # Dichotomic search
-        left = 0
-        right = len(blocks)
-
-        while left <= right:
-            center = (left + right) >> 1
-            block_start, block_data = blocks[center]
-
-            if block_start + len(block_data) <= address:  # after center block
-                left = center + 1
-            elif address < block_start:  # before center block
-                right = center - 1
-            else:  # within center block
-                return center
+        if block_index:
+            block_start, block_data = blocks[block_index - 1]
+            if address < block_start + len(block_data):  # within previous block
+                return block_index - 1
 
-        return left
+        return block_index
 
     def _erase(
         self,
@@ -610,19 +679,15 @@ class Memory(MutableMemory):
 
             # Delete initial part of deletion end block
             inner_start = block_index
-            for block_index in range(block_index, len(blocks)):
+            block_index = self._block_index_start(endex)  # inner ends before here
+            if block_index < inner_start:
+                block_index = inner_start  # start block already cut
+            if block_index < len(blocks):
                 block_start, block_data = blocks[block_index]
-                if endex <= block_start:
-                    break  # inner ends before here
-
-                block_endex = block_start + len(block_data)
-                if endex < block_endex:
+                if block_start < endex:
                     offset = endex - block_start
                     del block_data[:offset]
                     blocks[block_index][0] += offset  # update address
-                    break  # inner ends before here
-            else:
-                block_index = len(blocks)
             inner_endex = block_index
 
             if shift_after:
@@ -645,6 +710,54 @@ class Memory(MutableMemory):
             if inner_start < inner_endex:
                 del blocks[inner_start:inner_endex]
 
+    def _find(
+        self,
+        item: Union[AnyBytes, Value],
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+    ) -> Optional[Address]:
+        r"""Finds the address of an item.
+
+        Low-level method to search the underlying data structure.
+
+        Arguments:
+            item (items):
+                Value to find. Can be either some byte string or an integer.
+
+            start (int):
+                Inclusive start of the searched range.
+                If ``None``, :attr:`start` is considered.
+
+            endex (int):
+                Exclusive end of the searched range.
+                If ``None``, :attr:`endex` is considered.
+
+        Returns:
+            int: The address of the first item equal to `item`, or ``None``.
+        """
+
+        # Faster code for unbounded slice
+        if start is None and endex is None:
+            for block_start, block_data in self._blocks:
+                offset = block_data.find(item)
+                if offset >= 0:
+                    return block_start + offset
+            return None
+
+        # Bounded slice
+        start, endex = self.bound(start, endex)
+        block_index_start = self._block_index_start(start)
+        block_index_endex = self._block_index_endex(endex)
+        block_iterator = _islice(self._blocks, block_index_start, block_index_endex)
+
+        for block_start, block_data in block_iterator:
+            slice_start = 0 if start < block_start else start - block_start
+            slice_endex = endex - block_start
+            offset = block_data.find(item, slice_start, slice_endex)
+            if offset >= 0:
+                return block_start + offset
+        return None
+
     def _place(
         self,
         address: Address,
@@ -786,6 +899,55 @@ class Memory(MutableMemory):
         else:
             return self.__class__()
 
+    def _rfind(
+        self,
+        item: Union[AnyBytes, Value],
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+    ) -> Optional[Address]:
+        r"""Finds the last address of an item.
+
+        Low-level method to search the underlying data structure.
+
+        Arguments:
+            item (items):
+                Value to find. Can be either some byte string or an integer.
+
+            start (int):
+                Inclusive start of the searched range.
+                If ``None``, :attr:`start` is considered.
+
+            endex (int):
+                Exclusive end of the searched range.
+                If ``None``, :attr:`endex` is considered.
+
+        Returns:
+            int: The address of the last item equal to `item`, or ``None``.
+        """
+
+        # Faster code for unbounded slice
+        if start is None and endex is None:
+            for block_start, block_data in reversed(self._blocks):
+                offset = block_data.rfind(item)
+                if offset >= 0:
+                    return block_start + offset
+            return None
+
+        # Bounded slice
+        start, endex = self.bound(start, endex)
+        block_index_start = self._block_index_start(start)
+        block_index_endex = self._block_index_endex(endex)
+        blocks = self._blocks
+
+        for block_index in range(block_index_endex - 1, block_index_start - 1, -1):
+            block_start, block_data = blocks[block_index]
+            slice_start = 0 if start < block_start else start - block_start
+            slice_endex = endex - block_start
+            offset = block_data.rfind(item, slice_start, slice_endex)
+            if offset >= 0:
+                return block_start + offset
+        return None
+
     def align(
         self,
         modulo: int,
@@ -1169,30 +1331,12 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> Iterator[Tuple[Address, Value]]:
 
-        blocks = self._blocks
-        if blocks:
-            if start is None and endex is None:  # faster
-                for block_start, block_data in blocks:
-                    address = block_start + 0
-                    for value in block_data:
-                        yield address, value
-                        address += 1
-            else:
-                block_index_start = 0 if start is None else self._block_index_start(start)
-                block_index_endex = len(blocks) if endex is None else self._block_index_endex(endex)
-                start, endex = self.bound(start, endex)
-                block_iterator = _islice(blocks, block_index_start, block_index_endex)
-
-                for block_start, block_data in block_iterator:
-                    block_endex = block_start + len(block_data)
-                    slice_start = block_start if start < block_start else start
-                    slice_endex = endex if endex < block_endex else block_endex
-                    if slice_start < slice_endex:
-                        slice_view = memoryview(block_data)
-                        address = slice_start + 0
-                        for value in slice_view[(slice_start - block_start):(slice_endex - block_start)]:
-                            yield address, value
-                            address += 1
+        if start is None and endex is None:  # faster
+            for block_start, block_data in self._blocks:
+                yield from zip(range(block_start, block_start + len(block_data)), block_data)
+        else:
+            for block_start, block_view in self.blocks(start=start, endex=endex):
+                yield from zip(range(block_start, block_start + len(block_view)), block_view)
 
     def content_keys(
         self,
@@ -1258,24 +1402,12 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> Iterator[Value]:
 
-        blocks = self._blocks
-        if blocks:
-            if start is None and endex is None:  # faster
-                for block in blocks:
-                    yield from block[1]
-            else:
-                block_index_start = 0 if start is None else self._block_index_start(start)
-                block_index_endex = len(blocks) if endex is None else self._block_index_endex(endex)
-                start, endex = self.bound(start, endex)
-                block_iterator = _islice(blocks, block_index_start, block_index_endex)
-
-                for block_start, block_data in block_iterator:
-                    block_endex = block_start + len(block_data)
-                    slice_start = block_start if start < block_start else start
-                    slice_endex = endex if endex < block_endex else block_endex
-                    if slice_start < slice_endex:
-                        slice_view = memoryview(block_data)
-                        yield from slice_view[(slice_start - block_start):(slice_endex - block_start)]
+        if start is None and endex is None:  # faster
+            for _, block_data in self._blocks:
+                yield from block_data
+        else:
+            for _, block_view in self.blocks(start=start, endex=endex):
+                yield from block_view
 
     @ImmutableMemory.contiguous.getter
     def contiguous(
@@ -1286,12 +1418,11 @@ class Memory(MutableMemory):
         endex = self.endex
 
         if start < endex:
-            block_index = self._block_index_at(start)
-
-            if block_index is not None:
-                block_start, block_data = self._blocks[block_index]
-
-                if endex <= block_start + len(block_data):
+            # Blocks never touch, so only a single block can cover the span
+            blocks = self._blocks
+            if len(blocks) == 1:
+                block_start, block_data = blocks[0]
+                if block_start <= start and endex <= block_start + len(block_data):
                     return True
 
             return False
@@ -1305,6 +1436,9 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> int:
 
+        if not isinstance(item, Value):
+            item = bytes(item)  # convert once, not for each block
+
         # Faster code for unbounded slice
         if start is None and endex is None:
             return sum(block_data.count(item) for _, block_data in self._blocks)
@@ -1312,20 +1446,18 @@ class Memory(MutableMemory):
         # Bounded slice
         count = 0
         start, endex = self.bound(start, endex)
-        block_index_start = self._block_index_start(start)
-        block_index_endex = self._block_index_endex(endex)
-        block_iterator = _islice(self._blocks, block_index_start, block_index_endex)
-
-        for block_start, block_data in block_iterator:
-            slice_start = start - block_start
-            if slice_start < 0:
-                slice_start = 0
+        if start < endex:
+            block_index_start = self._block_index_start(start)
+            block_index_endex = self._block_index_endex(endex)
+            block_iterator = _islice(self._blocks, block_index_start, block_index_endex)
 
-            slice_endex = endex - block_start
-            # if slice_endex < slice_start:
-            #     slice_endex = slice_start
+            for block_start, block_data in block_iterator:
+                slice_start = start - block_start
+                if slice_start < 0:
+                    slice_start = 0
 
-            count += block_data.count(item, slice_start, slice_endex)
+                slice_endex = endex - block_start
+                count += block_data.count(item, slice_start, slice_endex)
         return count
 
     def copy(
@@ -1334,6 +1466,39 @@ class Memory(MutableMemory):
 
         return self.__deepcopy__()
 
+    def crc32(
+        self,
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+        pattern: Optional[Union[AnyBytes, Value]] = None,
+    ) -> int:
+
+        if start is None:
+            start = self.start
+        if endex is None:
+            endex = self.endex
+
+        if pattern is not None:
+            if isinstance(pattern, Value):
+                pattern = (pattern,)
+            pattern = bytes(pattern)
+            if not pattern:
+                raise ValueError('non-empty pattern required')
+
+        value = 0
+        address = start
+
+        for block_start, block_view in self.blocks(start=start, endex=endex):
+            if address < block_start:
+                value = _crc32_pattern(pattern, (address - start), (block_start - address), value)
+            value = zlib.crc32(block_view, value)
+            address = block_start + len(block_view)
+
+        if address < endex:
+            value = _crc32_pattern(pattern, (address - start), (endex - address), value)
+
+        return value
+
     def crop(
         self,
         start: Optional[Address] = None,
@@ -1523,22 +1688,29 @@ class Memory(MutableMemory):
             if block_start <= address < block_endex:
                 # Address within a block
                 offset = address - block_start
-                start = offset
-                endex = offset + 1
                 value = block_data[offset]
+                fill = bytes((value,))
 
-                for start in range(start, -1, -1):
-                    if block_data[start] != value:
-                        start += 1
+                # Strip growing windows, so that the scan runs in C
+                start = offset
+                window = 16
+                while start > 0:
+                    chunk = block_data[(start - window if start > window else 0):start]
+                    size = len(chunk) - len(chunk.rstrip(fill))
+                    start -= size
+                    if size < len(chunk):
                         break
-                else:
-                    start = 0
+                    window <<= 1
 
-                for endex in range(endex, len(block_data)):
-                    if block_data[endex] != value:
+                endex = offset + 1
+                window = 16
+                while endex < len(block_data):
+                    chunk = block_data[endex:(endex + window)]
+                    size = len(chunk) - len(chunk.lstrip(fill))
+                    endex += size
+                    if size < len(chunk):
                         break
-                else:
-                    endex = len(block_data)
+                    window <<= 1
 
                 block_endex = block_start + endex
                 block_start = block_start + start
@@ -1619,25 +1791,28 @@ class Memory(MutableMemory):
                 block_index_endex = len(blocks) if endex_ is None else self._block_index_endex(endex)
 
                 if block_index_start < block_index_endex:
-                    memory_blocks = _islice(blocks, block_index_start, block_index_endex)
-                    memory_blocks = [[block_start, bytearray(block_data)]
-                                     for block_start, block_data in memory_blocks]
-
-                    # Bound cloned data before the selection start address
-                    block_start, block_data = memory_blocks[0]
-                    if block_start < start:
-                        del block_data[:(start - block_start)]
-                        memory_blocks[0] = [start, block_data]
-
-                    # Bound cloned data after the selection end address
-                    block_start, block_data = memory_blocks[-1]
+                    # Copy only the selected part of the boundary blocks
+                    block_index_last = block_index_endex - 1
+                    block_start, block_data = blocks[block_index_start]
+                    slice_start = block_start if start < block_start else start
+                    memory_blocks = []
+
+                    if block_index_start < block_index_last:
+                        slice_view = memoryview(block_data)[(slice_start - block_start):]
+                        memory_blocks.append([slice_start, bytearray(slice_view)])
+
+                        memory_blocks.extend([block_start, bytearray(block_data)]
+                                             for block_start, block_data
+                                             in _islice(blocks, block_index_start + 1, block_index_last))
+
+                        block_start, block_data = blocks[block_index_last]
+                        slice_start = block_start
+
                     block_endex = block_start + len(block_data)
-                    if endex < block_endex:
-                        if block_start < endex:
-                            del block_data[(endex - block_start):]
-                            memory_blocks[-1] = [block_start, block_data]
-                        else:
-                            memory_blocks.pop()
+                    slice_endex = endex if endex < block_endex else block_endex
+                    if slice_start < slice_endex:
+                        slice_view = memoryview(block_data)[(slice_start - block_start):(slice_endex - block_start)]
+                        memory_blocks.append([slice_start, bytearray(slice_view)])
 
                     memory._blocks = memory_blocks
 
@@ -1731,10 +1906,41 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> Address:
 
-        try:
-            return self.index(item, start=start, endex=endex)
-        except ValueError:
-            return -1
+        address = self._find(item, start=start, endex=endex)
+        return -1 if address is None else address
+
+    def find_all(
+        self,
+        items: Iterable[Union[AnyBytes, Value]],
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+    ) -> Iterator[Tuple[Address, int]]:
+
+        items = [item if isinstance(item, Value) else bytes(item) for item in items]
+        if not all(isinstance(item, Value) or item for item in items):
+            raise ValueError('non-empty item required')
+
+        blocks = self._blocks
+        if start is None and endex is None:  # faster
+            start = self.start
+            endex = self.endex
+            block_iterator = blocks
+        else:
+            start, endex = self.bound(start, endex)
+            block_index_start = self._block_index_start(start)
+            block_index_endex = self._block_index_endex(endex)
+            block_iterator = _islice(blocks, block_index_start, block_index_endex)
+
+        for block_start, block_data in block_iterator:
+            slice_start = 0 if start < block_start else start - block_start
+            slice_endex = endex - block_start
+
+            # Each item is scanned lazily in C, merging matches by offset
+            finders = [_find_iter(block_data, item, index, slice_start, slice_endex)
+                       for index, item in enumerate(items)]
+
+            for offset, index in _merge(*finders):
+                yield block_start + offset, index
 
     def flood(
         self,
@@ -1853,6 +2059,15 @@ class Memory(MutableMemory):
         validate: bool = True,
     ) -> 'Memory':
 
+        if start is None and endex is None:  # faster
+            # A single block without bounds is always valid
+            memory = cls()
+            if data:
+                if copy:
+                    data = bytearray(data)
+                memory._blocks.append([Address(offset), data])
+            return memory
+
         if data:
             if copy:
                 data = bytearray(data)
@@ -1880,6 +2095,28 @@ class Memory(MutableMemory):
         keys = [key for key, value in items.items() if value is not None]
 
         if keys:
+            key_start = min(keys)
+            size = max(keys) + 1 - key_start
+
+            if size <= len(keys) * 8:  # dense: place values, then split runs
+                data = bytearray(size)
+                mask = bytearray(size)
+                for key, value in items.items():
+                    if value is not None:
+                        key -= key_start
+                        data[key] = value
+                        mask[key] = 1
+
+                run_start = 0  # the first key is always present
+                while run_start >= 0:
+                    run_endex = mask.find(0, run_start)
+                    if run_endex < 0:
+                        run_endex = size
+                    blocks.append([key_start + run_start + offset, data[run_start:run_endex]])
+                    run_start = mask.find(1, run_endex)
+
+                return cls.from_blocks(blocks, start=start, endex=endex, copy=False, validate=validate)
+
             keys.sort()
             key_seq = keys[0]
             block_start = key_seq
@@ -1972,10 +2209,7 @@ class Memory(MutableMemory):
     ) -> 'Memory':
 
         data = bytearray.fromhex(string)
-        obj = cls()
-        if data:
-            obj._blocks.append([0, data])
-        return obj
+        return cls.from_bytes(data, copy=False)
 
     def gaps(
         self,
@@ -2002,10 +2236,15 @@ class Memory(MutableMemory):
                 block_index_endex = self._block_index_endex(endex)
 
             block_iterator = _islice(blocks, block_index_start, block_index_endex)
-            for block_start, block_data in block_iterator:
+            for block_start, block_data in block_iterator:  # first block only
                 if start < block_start:
                     yield start, block_start
                 start = block_start + len(block_data)
+                break
+
+            for block_start, block_data in block_iterator:  # blocks never touch
+                yield start, block_start
+                start = block_start + len(block_data)
 
             if endex_ is None:
                 yield start, None
@@ -2130,34 +2369,10 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> Address:
 
-        # Faster code for unbounded slice
-        if start is None and endex is None:
-            for block_start, block_data in self._blocks:
-                try:
-                    offset = block_data.index(item)
-                except ValueError:
-                    continue
-                else:
-                    return block_start + offset
-            raise ValueError('subsection not found')
-
-        # Bounded slice
-        start, endex = self.bound(start, endex)
-        block_index_start = self._block_index_start(start)
-        block_index_endex = self._block_index_endex(endex)
-        block_iterator = _islice(self._blocks, block_index_start, block_index_endex)
-
-        for block_start, block_data in block_iterator:
-            slice_start = 0 if start < block_start else start - block_start
-            slice_endex = endex - block_start
-            try:
-                offset = block_data.index(item, slice_start, slice_endex)
-            except ValueError:
-                pass
-            else:
-                return block_start + offset
-        else:
+        address = self._find(item, start=start, endex=endex)
+        if address is None:
             raise ValueError('subsection not found')
+        return address
 
     def insert(
         self,
@@ -2165,8 +2380,9 @@ class Memory(MutableMemory):
         data: Union[AnyBytes, Value, ImmutableMemory],
     ) -> None:
 
-        size = 1 if isinstance(data, Value) else len(data)
-        self.reserve(address, size)
+        if address < self.content_endex:  # nothing to shift when appending
+            size = 1 if isinstance(data, Value) else len(data)
+            self.reserve(address, size)
         self.write(address, data, clear=True)
 
     def insert_backup(
@@ -2196,17 +2412,33 @@ class Memory(MutableMemory):
 
         blocks = self._blocks
         if blocks:
-            block_index_start = 0 if start is None else self._block_index_start(start)
-            block_index_endex = len(blocks) if endex is None else self._block_index_endex(endex)
-            start, endex = self.bound(start, endex)
-            block_iterator = _islice(blocks, block_index_start, block_index_endex)
+            if start is None and endex is None:  # faster
+                for block_start, block_data in blocks:
+                    yield block_start, block_start + len(block_data)
+            else:
+                block_index_start = 0 if start is None else self._block_index_start(start)
+                block_index_endex = len(blocks) if endex is None else self._block_index_endex(endex)
+                start, endex = self.bound(start, endex)
 
-            for block_start, block_data in block_iterator:
-                block_endex = block_start + len(block_data)
-                slice_start = block_start if start < block_start else start
-                slice_endex = endex if endex < block_endex else block_endex
-                if slice_start < slice_endex:
-                    yield slice_start, slice_endex
+                if block_index_start < block_index_endex:
+                    # Only the boundary blocks need clamping
+                    block_index_last = block_index_endex - 1
+                    block_start, block_data = blocks[block_index_start]
+                    slice_start = block_start if start < block_start else start
+
+                    if block_index_start < block_index_last:
+                        yield slice_start, block_start + len(block_data)
+
+                        for block_start, block_data in _islice(blocks, block_index_start + 1, block_index_last):
+                            yield block_start, block_start + len(block_data)
+
+                        block_start, block_data = blocks[block_index_last]
+                        slice_start = block_start
+
+                    block_endex = block_start + len(block_data)
+                    slice_endex = endex if endex < block_endex else block_endex
+                    if slice_start < slice_endex:
+                        yield slice_start, slice_endex
 
     def items(
         self,
@@ -2233,12 +2465,13 @@ class Memory(MutableMemory):
         if start is None:
             start = self.start
 
+        # Plain C iterators, no generator frame
         if endex is Ellipsis:
-            yield from _count(start)
+            return _count(start)
         else:
             if endex is None:
                 endex = self.endex
-            yield from range(start, endex)
+            return iter(range(start, endex))
 
     def peek(
         self,
@@ -2532,10 +2765,8 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> Address:
 
-        try:
-            return self.rindex(item, start=start, endex=endex)
-        except ValueError:
-            return -1
+        address = self._rfind(item, start=start, endex=endex)
+        return -1 if address is None else address
 
     def rindex(
         self,
@@ -2544,36 +2775,10 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> Address:
 
-        # Faster code for unbounded slice
-        if start is None and endex is None:
-            for block_start, block_data in reversed(self._blocks):
-                try:
-                    offset = block_data.index(item)
-                except ValueError:
-                    continue
-                else:
-                    return block_start + offset
-            else:
-                raise ValueError('subsection not found')
-
-        # Bounded slice
-        start, endex = self.bound(start, endex)
-        block_index_start = self._block_index_start(start)
-        block_index_endex = self._block_index_endex(endex)
-        blocks = self._blocks
-
-        for block_index in reversed(range(block_index_start, block_index_endex)):
-            block_start, block_data = blocks[block_index]
-            slice_start = 0 if start < block_start else start - block_start
-            slice_endex = endex - block_start
-            try:
-                offset = block_data.rindex(item, slice_start, slice_endex)
-            except ValueError:
-                pass
-            else:
-                return block_start + offset
-        else:
+        address = self._rfind(item, start=start, endex=endex)
+        if address is None:
             raise ValueError('subsection not found')
+        return address
 
     def rvalues(
         self,
@@ -2604,27 +2809,26 @@ class Memory(MutableMemory):
         else:
             block_index = self._block_index_endex(endex)
 
-        if 0 < block_index:
-            block_start, block_data = blocks[block_index - 1]
+        for block_index in range(block_index - 1, -1, -1):
+            block_start, block_data = blocks[block_index]
             block_endex = block_start + len(block_data)
+            if block_endex <= start:
+                break
 
             if block_endex < endex:
                 yield from _repeat2(pattern, pattern_size - (endex - start), endex - block_endex)
-                yield from reversed(block_data)
-            else:
-                yield from reversed(memoryview(block_data)[:(endex - block_start)])
-            endex = block_start
+                endex = block_endex
 
-            for block_index in range(block_index - 2, -1, -1):
-                block_start, block_data = blocks[block_index]
-                block_endex = block_start + len(block_data)
-                yield from _repeat2(pattern, pattern_size - (endex - start), endex - block_endex)
-                if start <= block_start:
+            if start <= block_start:
+                if endex == block_endex:
                     yield from reversed(block_data)
-                    endex = block_start
                 else:
-                    yield from reversed(memoryview(block_data)[(start - block_start):])
-                    endex = start
+                    yield from reversed(memoryview(block_data)[:(endex - block_start)])
+                endex = block_start
+            else:
+                yield from reversed(memoryview(block_data)[(start - block_start):(endex - block_start)])
+                endex = start
+                break
 
         size = None if start_ is Ellipsis else endex - start
         yield from _repeat2(pattern, pattern_size - (endex - start), size)
@@ -2726,8 +2930,12 @@ class Memory(MutableMemory):
         endex: Optional[Address] = None,
     ) -> BlockList:
 
-        blocks = [[block_start, bytes(block_data)]
-                  for block_start, block_data in self.blocks(start=start, endex=endex)]
+        if start is None and endex is None:  # faster
+            blocks = [[block_start, bytes(block_data)]
+                      for block_start, block_data in self._blocks]
+        else:
+            blocks = [[block_start, bytes(block_data)]
+                      for block_start, block_data in self.blocks(start=start, endex=endex)]
         return blocks
 
     def to_bytes(
@@ -2757,8 +2965,36 @@ class Memory(MutableMemory):
             if isinstance(data, Mapping):
                 data = data.items()
             poke = self.poke
+            write = self.write
+            run_start = run_endex = None
+            run = None
+
+            def flush_run():
+                if len(run) > 1:
+                    write(run_start, run)
+                else:
+                    poke(run_start, run[0])
+
+            # Gather consecutive byte values into runs, written at once
             for address, value in data:
-                poke(address, value)
+                is_byte = isinstance(value, Value) and 0 <= value <= 0xFF
+                if address == run_endex and is_byte:
+                    run.append(value)
+                    run_endex += 1
+                else:
+                    if run is not None:
+                        flush_run()  # before any failure on the current item
+
+                    if is_byte:
+                        run = bytearray((value,))
+                        run_start = address
+                        run_endex = address + 1
+                    else:
+                        poke(address, value)
+                        run = run_endex = None
+
+            if run is not None:
+                flush_run()
 
     def update_backup(
         self,
@@ -2870,8 +3106,38 @@ class Memory(MutableMemory):
             if start is None:
                 start = self.start
             if start < endex:
-                values = self.values(start=start, endex=Ellipsis, pattern=pattern)
-                yield from _islice(values, (endex - start))
+                if pattern is not None:
+                    if isinstance(pattern, Value):
+                        pattern = (pattern,)
+                        pattern = bytearray(pattern)
+                    if not pattern:
+                        raise ValueError('non-empty pattern required')
+
+                start_ = start
+                block_index = self._block_index_start(start)
+                block_iterator = _islice(self._blocks, block_index, None)
+
+                for block_start, block_data in block_iterator:
+                    if endex <= block_start:
+                        break
+
+                    if start < block_start:
+                        yield from _repeat2(pattern, (start - start_), (block_start - start))
+                        start = block_start
+
+                    block_endex = block_start + len(block_data)
+                    if endex <= block_endex:
+                        yield from memoryview(block_data)[(start - block_start):(endex - block_start)]
+                        start = endex
+                        break
+
+                    if start == block_start:
+                        yield from block_data
+                    else:
+                        yield from memoryview(block_data)[(start - block_start):]
+                    start = block_endex
+
+                yield from _repeat2(pattern, (start - start_), (endex - start))
 
     def view(
         self,
@@ -2995,6 +3261,15 @@ class Memory(MutableMemory):
                     block_data += data  # faster
                     return
 
+                # Check if overwriting within a single block
+                block_index = self._block_index_at(start)
+                if block_index is not None:
+                    block_start, block_data = blocks[block_index]
+                    if endex <= block_start + len(block_data):
+                        offset = start - block_start
+                        block_data[offset:(offset + size)] = data  # faster
+                        return
+
             # Standard write method
             self._erase(start, endex, False)  # clear
             self._place(start, data, False)  # write
@@ -3014,9 +3289,8 @@ class Memory(MutableMemory):
             elif clear:
                 backups = [self.extract(start=start, endex=endex)]
             else:
-                intervals = data.intervals(start=start, endex=endex)
-                backups = [self.extract(start=block_start, endex=block_endex)
-                           for block_start, block_endex in intervals]
+                backups = [self.extract(start=(block_start + address), endex=(block_endex + address))
+                           for block_start, block_endex in data.intervals()]
         else:
             if isinstance(data, Value):
                 data = (data,)
@@ -3028,6 +3302,62 @@ class Memory(MutableMemory):
                 backups = []
         return backups
 
+    def write_many(
+        self,
+        items: Iterable[Tuple[Address, Union[AnyBytes, Value, ImmutableMemory]]],
+        clear: bool = False,
+    ) -> None:
+
+        write = self.write
+        run_start = run_endex = None
+        run = None
+
+        # Join byte chunks continuing right after the previous one
+        for address, data in items:
+            if isinstance(data, ImmutableMemory):
+                if run is not None:
+                    write(run_start, run)
+                    run = run_endex = None
+                write(address, data, clear=clear)
+
+            elif address == run_endex:
+                if isinstance(data, Value):
+                    run.append(data)
+                    run_endex += 1
+                else:
+                    run += data
+                    run_endex += len(data)
+            else:
+                if run is not None:
+                    write(run_start, run)
+
+                run = bytearray((data,)) if isinstance(data, Value) else bytearray(data)
+                run_start = address
+                run_endex = address + len(run)
+
+        if run is not None:
+            write(run_start, run)
+
+    def write_many_backup(
+        self,
+        items: Iterable[Tuple[Address, Union[AnyBytes, Value, ImmutableMemory]]],
+        clear: bool = False,
+    ) -> List[ImmutableMemory]:
+
+        write_backup = self.write_backup
+        backups = []
+        for address, data in items:
+            backups.extend(write_backup(address, data, clear=clear))
+        return backups
+
+    def write_many_restore(
+        self,
+        backups: Sequence[ImmutableMemory],
+    ) -> None:
+
+        for backup in backups:
+            self.write(0, backup, clear=True)
+
     def write_restore(
         self,
         backups: Sequence[ImmutableMemory],
@@ -3194,6 +3524,16 @@ class bytesparse(Memory, MutableBytesparse):
         start, endex = self._rectify_span(start, endex)
         return super().count(item, start=start, endex=endex)
 
+    def crc32(
+        self,
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+        pattern: Optional[Union[AnyBytes, Value]] = None,
+    ) -> int:
+
+        start, endex = self._rectify_span(start, endex)
+        return super().crc32(start=start, endex=endex, pattern=pattern)
+
     def crop(
         self,
         start: Optional[Address] = None,
@@ -3289,6 +3629,16 @@ class bytesparse(Memory, MutableBytesparse):
         start, endex = self._rectify_span(start, endex)
         return super().find(item, start=start, endex=endex)
 
+    def find_all(
+        self,
+        items: Iterable[Union[AnyBytes, Value]],
+        start: Optional[Address] = None,
+        endex: Optional[Address] = None,
+    ) -> Iterator[Tuple[Address, int]]:
+
+        start, endex = self._rectify_span(start, endex)
+        yield from super().find_all(items, start=start, endex=endex)
+
     def flood(
         self,
         start: Optional[Address] = None,
@@ -3511,7 +3861,7 @@ class bytesparse(Memory, MutableBytesparse):
         start, endex = self._rectify_span(start, endex)
         if endex_ is Ellipsis:
             endex = endex_  # restore
-        yield from super().keys(start=start, endex=endex)
+        return super().keys(start=start, endex=endex)
 
     def peek(
         self,
@@ -3830,3 +4180,23 @@ class bytesparse(Memory, MutableBytesparse):
 
         address = self._rectify_address(address)
         return super().write_backup(address, data, clear=clear)
+
+    def write_many(
+        self,
+        items: Iterable[Tuple[Address, Union[AnyBytes, Value, ImmutableMemory]]],
+        clear: bool = False,
+    ) -> None:
+
+        rectify_address = self._rectify_address
+        items = ((rectify_address(address), data) for address, data in items)
+        super().write_many(items, clear=clear)
+
+    def write_many_backup(
+        self,
+        items: Iterable[Tuple[Address, Union[AnyBytes, Value, ImmutableMemory]]],
+        clear: bool = False,
+    ) -> List[ImmutableMemory]:
+
+        rectify_address = self._rectify_address
+        items = ((rectify_address(address), data) for address, data in items)
+        return super().write_many_backup(items, clear=clear)
@@ -25,6 +25,7 @@
 
 import io
 import sys
+import zlib
 from contextlib import redirect_stdout
 from itertools import islice
 from typing import Any
@@ -607,6 +608,22 @@ class BaseMemorySuite:
         memory = Memory.from_items(enumerate(values))
         assert memory.to_blocks() == blocks
 
+    def test_from_items_sparse(self):
+        Memory = self.Memory
+        items = [(1000, ord('z')), (0, ord('A')), (1, ord('B')), (500, None)]
+        memory = Memory.from_items(items, offset=3)
+        assert memory.to_blocks() == [[3, b'AB'], [1003, b'z']]
+
+    def test_from_items_unsorted(self):
+        Memory = self.Memory
+        blocks = create_template_blocks()
+        values = blocks_to_values(blocks)
+        items = list(enumerate(values))
+        items.reverse()
+
+        memory = Memory.from_items(items)
+        assert memory.to_blocks() == blocks
+
     def test_from_memory_doctest(self):
         Memory = self.Memory
 
@@ -1150,6 +1167,49 @@ class BaseMemorySuite:
         assert memory.find(b'o') == 6
         assert memory.find(b'l') == 4
 
+    def test_find_all_doctest(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[1, b'ABC'], [5, b'Bat'], [9, b'tab']])
+        ans_out = list(memory.find_all([b'a', b'B']))
+        assert ans_out == [(2, 1), (5, 1), (6, 0), (10, 0)]
+        ans_out = list(memory.find_all([b'at', ord('t'), b'ta'], 6, 11))
+        assert ans_out == [(6, 0), (7, 1), (9, 1), (9, 2)]
+
+    def test_find_all(self):
+        Memory = self.Memory
+        blocks = create_hello_world_blocks()
+        memory = Memory.from_blocks(blocks)
+        values = blocks_to_values(blocks, MAX_SIZE)
+        items = [b'l', b'lo', ord('o'), b'X', bytearray(b'll')]
+
+        for start in range(MAX_START):
+            for endex in range(start, MAX_START):
+                expected = []
+                for address in range(start, endex):
+                    for index, item in enumerate(items):
+                        if isinstance(item, int):
+                            item = (item,)
+                        size = len(item)
+                        if address + size <= endex and values[address:(address + size)] == list(item):
+                            expected.append((address, index))
+
+                assert list(memory.find_all(items, start, endex)) == expected
+
+        assert list(memory.find_all([b'o', b'l'])) == list(memory.find_all([b'o', b'l'], 0, MAX_SIZE))
+        assert list(memory.find_all([])) == []
+
+    def test_find_all_overlapping(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[3, b'aaaa']])
+        assert list(memory.find_all([b'aa'])) == [(3, 0), (4, 0), (5, 0)]
+
+    def test_find_all_empty_item(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[3, b'aaaa']])
+
+        with pytest.raises(ValueError, match='non-empty item required'):
+            list(memory.find_all([b'a', b'']))
+
     def test_rfind_doctest(self):
         pass  # no doctest
 
@@ -1270,6 +1330,30 @@ class BaseMemorySuite:
                 index = memory.rindex(bytes([c]))
                 assert index == expected
 
+    def test_rindex_repeated(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[1, b'ABA'], [6, b'BAB']])
+        assert memory.rindex(b'A') == 7
+        assert memory.rindex(b'B') == 8
+        assert memory.rindex(b'A', endex=6) == 3
+        assert memory.rfind(b'BA') == 6
+        assert memory.rfind(b'AB', endex=4) == 1
+        assert memory.rfind(b'C') == -1
+
+    def test_index_negative(self):
+        Memory = self.Memory
+        if self.ADDR_NEG:
+            memory = Memory.from_blocks([[-3, b'ABC'], [2, b'xyz']])
+            assert memory.index(b'B') == -2
+            assert memory.rindex(b'C') == -1
+            assert memory.index(b'C', start=-1) == -1
+            assert memory.rindex(b'A', endex=0) == -3
+            with pytest.raises(ValueError, match='subsection not found'):
+                memory.index(b'A', start=-2)
+
+            memory.remove(b'B')
+            assert memory.to_blocks() == [[-3, b'AC'], [1, b'xyz']]
+
     def test_remove_doctest(self):
         Memory = self.Memory
         memory = Memory.from_blocks([[1, b'ABCD'], [6, b'$'], [8, b'xyz']])
@@ -1429,6 +1513,56 @@ class BaseMemorySuite:
                     count = memory.count(bytes([c]), start, endex)
                     assert count == expected
 
+    def test_count_item_types(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[1, b'ABC'], [5, b'Bat'], [9, b'tab']])
+
+        for item in (b'ab', bytearray(b'ab'), memoryview(b'ab'), [97, 98]):
+            assert memory.count(item) == 1
+            assert memory.count(item, 9, 12) == 1
+            assert memory.count(item, 9, 11) == 0
+
+        assert memory.count(b'a', 7, 7) == 0
+        assert memory.count(b'a', 8, 4) == 0
+
+    def test_crc32_doctest(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[1, b'ABC'], [5, b'xyz']])
+        assert memory.crc32(1, 4) == zlib.crc32(b'ABC')
+        assert memory.crc32(pattern=b'.') == 0x76F19335
+        assert memory.crc32(pattern=b'.') == zlib.crc32(b'ABC.xyz')
+
+        with pytest.raises(ValueError, match='non-contiguous'):
+            memory.crc32()
+
+    def test_crc32_empty(self):
+        Memory = self.Memory
+        memory = Memory()
+        assert memory.crc32() == 0
+        assert memory.crc32(pattern=0) == 0
+        assert memory.crc32(3, 3) == 0
+
+        memory = Memory.from_bytes(b'ABC')
+        with pytest.raises(ValueError, match='non-empty pattern required'):
+            memory.crc32(pattern=b'')
+
+    def test_crc32_template(self):
+        Memory = self.Memory
+        blocks = create_template_blocks()
+        memory = Memory.from_blocks(blocks)
+
+        for start in range(MAX_START):
+            for endex in range(start, MAX_SIZE):
+                for pattern in (0xFF, b'xyz'):
+                    expected = zlib.crc32(bytes(memory.values(start, endex, pattern)))
+                    assert memory.crc32(start, endex, pattern) == expected
+
+    def test_crc32_large_gap(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[0, b'A'], [0x30000, b'B']])
+        expected = zlib.crc32(b'A' + (b'xyz' * 0x10000)[1:0x30000] + b'B')
+        assert memory.crc32(pattern=b'xyz') == expected
+
     def test___getitem___doctest(self):
         Memory = self.Memory
         memory = Memory.from_blocks([[1, b'ABCD'], [6, b'$'], [8, b'xyz']])
@@ -3633,6 +3767,32 @@ class BaseMemorySuite:
         memory.validate()
         assert memory == memory_backup
 
+    def test_update_runs(self):
+        Memory = self.Memory
+        data = [(1, ord('A')), (2, ord('B')), (3, None), (4, b'D'), (5, ord('E')),
+                (6, ord('F')), (2, ord('b')), (3, ord('c')), (9, ord('x'))]
+        memory = Memory.from_blocks([[0, b'0123456789']], endex=9)
+        memory_ref = memory.__deepcopy__()
+
+        memory.update(data)
+        memory.validate()
+        for address, value in data:
+            memory_ref.poke(address, value)
+        assert memory == memory_ref
+        assert memory.to_blocks() == [[0, b'0AbcDEF78']]
+
+    def test_update_invalid_value(self):
+        Memory = self.Memory
+        memory = Memory()
+        with pytest.raises(ValueError):
+            memory.update([(0, 65), (1, 66), (2, 300)])
+        assert memory.to_blocks() == [[0, b'AB']]
+
+        memory = Memory(start=0, endex=4)
+        memory.update({9: 300})  # out of bounds, ignored
+        memory.update([(2, 65), (3, 66), (4, 300)])
+        assert memory.to_blocks() == [[2, b'AB']]
+
     def test_update_kwargs(self):
         Memory = self.Memory
         memory = Memory()
@@ -4026,6 +4186,15 @@ class BaseMemorySuite:
         memory.insert(8, b'1')
         assert memory.to_blocks() == [[1, b'ABC'], [6, b'xy1z'], [11, b'$']]
 
+    def test_insert_append(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[1, b'ABC']], endex=8)
+        memory.insert(4, b'xy')
+        assert memory.to_blocks() == [[1, b'ABCxy']]
+        memory.insert(7, b'123')
+        memory.validate()
+        assert memory.to_blocks() == [[1, b'ABCxy'], [7, b'1']]
+
     def test_insert_single(self):
         Memory = self.Memory
         for start in range(MAX_START):
@@ -4452,6 +4621,14 @@ class BaseMemorySuite:
         backups = memory.write_backup(0, b'')
         assert backups == []
 
+    def test_write_backup_memory_offset(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[8, b'89A']])
+        data = Memory.from_blocks([[1, b'<'], [3, b'>']])
+
+        backups = memory.write_backup(8, data)
+        assert [backup.to_blocks() for backup in backups] == [[[9, b'9']], []]
+
     def test_write_backup_value(self):
         Memory = self.Memory
         memory = Memory()
@@ -4459,6 +4636,56 @@ class BaseMemorySuite:
         backup, = memory.write_backup(0, 123)
         assert backup.span == (0, 1)
 
+    def test_write_many_doctest(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks([[1, b'ABC'], [6, b'xyz']])
+        memory.write_many([(5, b'12'), (7, b'3'), (9, ord('$'))])
+        assert memory.to_blocks() == [[1, b'ABC'], [5, b'123z$']]
+
+    def test_write_many_empty(self):
+        Memory = self.Memory
+        memory = Memory.from_blocks(create_template_blocks())
+        memory.write_many([])
+        assert memory.to_blocks() == create_template_blocks()
+
+    def test_write_many_sequential(self):
+        Memory = self.Memory
+        items = [(2, b'ab'), (4, ord('c')), (5, b''), (5, b'de'), (3, b'XY'),
+                 (12, Memory.from_blocks([[1, b'<'], [3, b'>']])), (16, b'!'),
+                 (17, b'?'), (20, ord('.'))]
+
+        for clear in (False, True):
+            memory = Memory.from_blocks(create_template_blocks())
+            memory.bound_endex = 21
+            memory_ref = memory.__deepcopy__()
+
+            memory.write_many(items, clear=clear)
+            memory.validate()
+            for address, data in items:
+                memory_ref.write(address, data, clear=clear)
+            assert memory == memory_ref
+
+    def test_write_many_backup_doctest(self):
+        pass  # no doctest
+
+    def test_write_many_restore(self):
+        Memory = self.Memory
+        items = [(2, b'ab'), (4, ord('c')), (5, b'de'), (3, b'XY'),
+                 (8, Memory.from_blocks([[1, b'<'], [3, b'>']]))]
+
+        for clear in (False, True):
+            memory = Memory.from_blocks(create_template_blocks())
+            memory_backup = memory.__deepcopy__()
+
+            backups = memory.write_many_backup(items, clear=clear)
+            memory.write_many(items, clear=clear)
+            memory.write_many_restore(backups)
+            memory.validate()
+            assert memory == memory_backup
+
+    def test_write_many_restore_doctest(self):
+        pass  # no doctest
+
     def test_write_restore_doctest(self):
         pass  # no doctest
 
@@ -4892,6 +5119,19 @@ class BaseMemorySuite:
                     rvalues_ref = list(islice(values, start, endex))[::-1]
                 assert rvalues_out == rvalues_ref
 
+    def test_rvalues_bounded_template(self):
+        Memory = self.Memory
+        for start in range(MAX_START):
+            for size in range(MAX_SIZE):
+                blocks = create_template_blocks()
+                values = blocks_to_values(blocks, MAX_SIZE)
+                memory = Memory.from_blocks(blocks)
+                endex = start + size
+
+                rvalues_out = list(memory.rvalues(start, endex))
+                rvalues_ref = list(islice(values, start, endex))[::-1]
+                assert rvalues_out == rvalues_ref
+
     def test_rvalues_pattern_template(self):
         Memory = self.Memory
         pattern = b'0123456789ABCDEF'
@@ -5098,6 +5338,18 @@ class BaseMemorySuite:
                 assert value is not None
                 assert (start, endex) == span
 
+    def test_equal_span_long(self):
+        Memory = self.Memory
+        data = b'A' + (b'B' * 1000) + b'C' + (b'D' * 100)
+        memory = Memory.from_bytes(data, offset=5)
+
+        assert memory.equal_span(5) == (5, 6, 0x41)
+        for address in (6, 7, 500, 1004, 1005):
+            assert memory.equal_span(address) == (6, 1006, 0x42)
+        assert memory.equal_span(1006) == (1006, 1007, 0x43)
+        for address in (1007, 1050, 1106):
+            assert memory.equal_span(address) == (1007, 1107, 0x44)
+
     def test_equal_span_empty(self):
         Memory = self.Memory
         blocks = []
@@ -28,10 +28,22 @@ from typing import Type
 from _common import *
 
 from bytesparse.inplace import Memory as _Memory
+from bytesparse.inplace import _bisect_blocks
+from bytesparse.inplace import _bisect_blocks_py
 from bytesparse.inplace import _repeat2
 from bytesparse.inplace import bytesparse as _bytesparse
 
 
+def test__bisect_blocks():
+    for bisect_blocks in (_bisect_blocks, _bisect_blocks_py):
+        assert bisect_blocks([], 0) == 0
+
+        blocks = [[1, b'ABCD'], [6, b'$'], [8, b'xyz']]
+        ans_out = [bisect_blocks(blocks, address) for address in range(12)]
+        ans_ref = [0, 1, 1, 1, 1, 1, 2, 2, 3, 3, 3, 3]
+        assert ans_out == ans_ref
+
+
 def test__repeat2_empty_pattern_infinite():
     ans_out = bytes(islice(_repeat2(b'abc', 0, None), 8))
     ans_ref = b'abcabcab'
@@ -60,6 +72,15 @@ def test__repeat2_empty_pattern_sized():
     assert ans_out == ans_ref
 
 
+def test__repeat2_pattern_long():
+    for pattern in (b'a', b'abc', bytes(range(251))):
+        for offset in (0, 1, -1, 1000):
+            for size in (0, 1, 4095, 4096, 4097, 10000):
+                ans_out = bytes(_repeat2(pattern, offset, size))
+                ans_ref = bytes(pattern[(offset + i) % len(pattern)] for i in range(size))
+                assert ans_out == ans_ref
+
+
 class TestMemory(BaseMemorySuite):
     Memory: Type['_Memory'] = _Memory
 
@@ -169,6 +190,24 @@ class TestMemory(BaseMemorySuite):
         with pytest.raises(ValueError, match='invalid block bounds'):
             memory.validate()
 
+    def test__block_index_at_cache(self):
+        Memory = self.Memory
+        blocks = [[1, b'ABC'], [6, b'xyz']]
+        memory = Memory.from_blocks(blocks)
+        assert memory._block_index_at(7) == 1
+        assert memory._block_index_cache == 1
+        assert memory._block_index_at(8) == 1
+        assert memory._block_index_at(2) == 0
+        assert memory._block_index_cache == 0
+        assert memory._block_index_at(4) is None
+        assert memory._block_index_cache == 0
+
+        memory._block_index_cache = 1
+        del memory[0:6]
+        assert memory._blocks == [[0, b'xyz']]
+        assert memory._block_index_at(1) == 0
+        assert memory._block_index_at(3) is None
+
     def test__place_nothing(self):
         Memory = self.Memory
         blocks = [[1, b'ABC'], [6, b'xyz']]